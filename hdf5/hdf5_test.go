@@ -111,7 +111,7 @@ func TestReadMinimalDataset(t *testing.T) {
 }
 
 func TestReadFloats(t *testing.T) {
-	path := skipIfNoTestdata(t, "floats.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -120,7 +120,7 @@ func TestReadFloats(t *testing.T) {
 	defer f.Close()
 
 	// Test float32
-	ds32, err := f.OpenDataset("float32")
+	ds32, err := f.OpenDataset("floats/float32")
 	if err != nil {
 		t.Fatalf("OpenDataset float32 failed: %v", err)
 	}
@@ -138,7 +138,7 @@ func TestReadFloats(t *testing.T) {
 	}
 
 	// Test float64
-	ds64, err := f.OpenDataset("float64")
+	ds64, err := f.OpenDataset("floats/float64")
 	if err != nil {
 		t.Fatalf("OpenDataset float64 failed: %v", err)
 	}
@@ -157,7 +157,7 @@ func TestReadFloats(t *testing.T) {
 }
 
 func TestReadIntegers(t *testing.T) {
-	path := skipIfNoTestdata(t, "integers.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -166,7 +166,7 @@ func TestReadIntegers(t *testing.T) {
 	defer f.Close()
 
 	// Test int32
-	ds, err := f.OpenDataset("int32")
+	ds, err := f.OpenDataset("integers/int32")
 	if err != nil {
 		t.Fatalf("OpenDataset int32 failed: %v", err)
 	}
@@ -185,7 +185,7 @@ func TestReadIntegers(t *testing.T) {
 }
 
 func TestReadMultidim(t *testing.T) {
-	path := skipIfNoTestdata(t, "multidim.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -193,7 +193,7 @@ func TestReadMultidim(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("2d")
+	ds, err := f.OpenDataset("multidim/2d")
 	if err != nil {
 		t.Fatalf("OpenDataset 2d failed: %v", err)
 	}
@@ -284,7 +284,7 @@ func TestGroupNavigation(t *testing.T) {
 }
 
 func TestDatasetAttributes(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -292,7 +292,7 @@ func TestDatasetAttributes(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("data")
+	ds, err := f.OpenDataset("attributes/data")
 	if err != nil {
 		t.Fatalf("OpenDataset failed: %v", err)
 	}
@@ -431,7 +431,7 @@ func TestV0SuperblockIntegers(t *testing.T) {
 }
 
 func TestReadAttributeValues(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -439,7 +439,7 @@ func TestReadAttributeValues(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("data")
+	ds, err := f.OpenDataset("attributes/data")
 	if err != nil {
 		t.Fatalf("OpenDataset failed: %v", err)
 	}
@@ -531,7 +531,7 @@ func TestVarLenStringAttributes(t *testing.T) {
 }
 
 func TestCompoundAttributes(t *testing.T) {
-	path := skipIfNoTestdata(t, "compound_attrs.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -539,7 +539,7 @@ func TestCompoundAttributes(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("data")
+	ds, err := f.OpenDataset("compound_attrs/data")
 	if err != nil {
 		t.Fatalf("OpenDataset failed: %v", err)
 	}
@@ -594,7 +594,7 @@ func TestCompoundAttributes(t *testing.T) {
 }
 
 func TestArrayAttributes(t *testing.T) {
-	path := skipIfNoTestdata(t, "array_attrs.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -602,7 +602,7 @@ func TestArrayAttributes(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("data")
+	ds, err := f.OpenDataset("array_attrs/data")
 	if err != nil {
 		t.Fatalf("OpenDataset failed: %v", err)
 	}
@@ -652,7 +652,7 @@ func TestArrayAttributes(t *testing.T) {
 }
 
 func TestFileAttributes(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -673,9 +673,15 @@ func TestFileAttributes(t *testing.T) {
 	}
 
 	if !found {
-		t.Log("Root attributes:", attrs)
-		// File-level attributes may be stored differently
-		// This is acceptable if file_attr is not on root group
+		t.Fatalf("file_attr not found on root group, got %v", attrs)
+	}
+
+	val, err := root.Attr("file_attr").ReadScalarString()
+	if err != nil {
+		t.Fatalf("ReadScalarString failed: %v", err)
+	}
+	if val != "file level attribute" {
+		t.Errorf("file_attr = %q, want %q", val, "file level attribute")
 	}
 }
 
@@ -757,9 +763,9 @@ func TestReadCompressedChunkedDataset(t *testing.T) {
 		}
 	})
 
-	// Test shuffle + gzip compressed dataset
-	t.Run("shuffle_gzip", func(t *testing.T) {
-		ds, err := f.OpenDataset("shuffle_gzip")
+	// Test shuffle + LZF compressed dataset
+	t.Run("shuffle_lzf", func(t *testing.T) {
+		ds, err := f.OpenDataset("shuffle_lzf")
 		if err != nil {
 			t.Fatalf("OpenDataset failed: %v", err)
 		}
@@ -781,6 +787,37 @@ func TestReadCompressedChunkedDataset(t *testing.T) {
 			}
 		}
 	})
+
+	// Both datasets are written from the same seeded payload
+	t.Run("same_payload", func(t *testing.T) {
+		gzipDS, err := f.OpenDataset("gzip")
+		if err != nil {
+			t.Fatalf("OpenDataset gzip failed: %v", err)
+		}
+		lzfDS, err := f.OpenDataset("shuffle_lzf")
+		if err != nil {
+			t.Fatalf("OpenDataset shuffle_lzf failed: %v", err)
+		}
+
+		gzipData, err := gzipDS.ReadFloat64()
+		if err != nil {
+			t.Fatalf("ReadFloat64 gzip failed: %v", err)
+		}
+		lzfData, err := lzfDS.ReadFloat64()
+		if err != nil {
+			t.Fatalf("ReadFloat64 shuffle_lzf failed: %v", err)
+		}
+
+		if len(gzipData) != len(lzfData) {
+			t.Fatalf("length mismatch: gzip %d, shuffle_lzf %d", len(gzipData), len(lzfData))
+		}
+		for i := range gzipData {
+			if gzipData[i] != lzfData[i] {
+				t.Errorf("data[%d]: gzip %f != shuffle_lzf %f", i, gzipData[i], lzfData[i])
+				break
+			}
+		}
+	})
 }
 
 func TestSoftLinks(t *testing.T) {
@@ -1992,3 +2029,42 @@ func TestBTreeV2Compressed(t *testing.T) {
 		}
 	}
 }
+
+// TestBTreeV2UnsupportedFilter tests that a B-tree v2 dataset using an
+// unimplemented optional filter (Blosc) opens but fails to read
+func TestBTreeV2UnsupportedFilter(t *testing.T) {
+	path := skipIfNoTestdata(t, "btree_v2_compressed.h5")
+
+	f, err := Open(path)
+	if err != nil {
+		t.Fatalf("Open failed: %v", err)
+	}
+	defer f.Close()
+
+	members, err := f.Root().Members()
+	if err != nil {
+		t.Fatalf("Members failed: %v", err)
+	}
+	found := false
+	for _, m := range members {
+		if m == "blosc" {
+			found = true
+		}
+	}
+	if !found {
+		t.Skip("blosc dataset not present (generate.py was run without hdf5plugin)")
+	}
+
+	ds, err := f.OpenDataset("blosc")
+	if err != nil {
+		t.Fatalf("OpenDataset blosc failed: %v", err)
+	}
+
+	_, err = ds.ReadFloat64()
+	if err == nil {
+		t.Fatal("expected error reading Blosc-compressed data")
+	}
+	if !strings.Contains(err.Error(), "Blosc") {
+		t.Errorf("expected error to mention Blosc, got: %v", err)
+	}
+}
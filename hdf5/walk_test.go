@@ -96,7 +96,7 @@ func TestSplitPathUtil(t *testing.T) {
 }
 
 func TestAttributeValue(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -104,7 +104,7 @@ func TestAttributeValue(t *testing.T) {
 	}
 	defer f.Close()
 
-	ds, err := f.OpenDataset("data")
+	ds, err := f.OpenDataset("attributes/data")
 	if err != nil {
 		t.Fatalf("OpenDataset failed: %v", err)
 	}
@@ -145,7 +145,7 @@ func TestAttributeValue(t *testing.T) {
 }
 
 func TestGetAttr(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -154,7 +154,7 @@ func TestGetAttr(t *testing.T) {
 	defer f.Close()
 
 	// Test getting attribute by path
-	attr, err := f.GetAttr("/data@float_attr")
+	attr, err := f.GetAttr("/attributes/data@float_attr")
 	if err != nil {
 		t.Fatalf("GetAttr failed: %v", err)
 	}
@@ -174,7 +174,7 @@ func TestGetAttr(t *testing.T) {
 }
 
 func TestReadAttr(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -183,7 +183,7 @@ func TestReadAttr(t *testing.T) {
 	defer f.Close()
 
 	// Test reading attribute value directly
-	val, err := f.ReadAttr("/data@string_attr")
+	val, err := f.ReadAttr("/attributes/data@string_attr")
 	if err != nil {
 		t.Fatalf("ReadAttr failed: %v", err)
 	}
@@ -194,7 +194,7 @@ func TestReadAttr(t *testing.T) {
 }
 
 func TestGetAttrNotFound(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -203,7 +203,7 @@ func TestGetAttrNotFound(t *testing.T) {
 	defer f.Close()
 
 	// Test non-existent attribute
-	_, err = f.GetAttr("/data@nonexistent")
+	_, err = f.GetAttr("/attributes/data@nonexistent")
 	if err == nil {
 		t.Error("expected error for non-existent attribute")
 	}
@@ -216,7 +216,7 @@ func TestGetAttrNotFound(t *testing.T) {
 }
 
 func TestWalkAttrs(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -282,7 +282,7 @@ func TestWalkAttrsWithGroups(t *testing.T) {
 }
 
 func TestWalkAttrsStopEarly(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -306,7 +306,7 @@ func TestWalkAttrsStopEarly(t *testing.T) {
 }
 
 func TestWalkAttrsCompound(t *testing.T) {
-	path := skipIfNoTestdata(t, "compound_attrs.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -334,7 +334,7 @@ func TestWalkAttrsCompound(t *testing.T) {
 }
 
 func TestAttrInfoFields(t *testing.T) {
-	path := skipIfNoTestdata(t, "attributes.h5")
+	path := skipIfNoTestdata(t, "fixtures_bundle.h5")
 
 	f, err := Open(path)
 	if err != nil {
@@ -19,6 +19,9 @@
 //     data integrity by checking a 32-bit Fletcher checksum appended to
 //     the data.
 //
+// It also implements the LZF filter (ID 32000) via [LZF], the fast
+// compressor that h5py registers and uses for compression='lzf'.
+//
 // # Unsupported Filters
 //
 // The following filters are recognized but not implemented:
@@ -26,9 +29,11 @@
 //   - SZIP (ID 4): Proprietary compression algorithm
 //   - N-bit (ID 5): Bit-level packing
 //   - Scale-offset (ID 6): Integer scaling and offset
+//   - Blosc (ID 32001): Third-party meta-compressor (e.g. written via hdf5plugin)
 //
-// Datasets using unsupported filters cannot be read. However, optional filters
-// (marked in the filter pipeline) can be skipped if not available.
+// Datasets using unsupported filters cannot be read. Optional filters (marked
+// in the filter pipeline) do not prevent building the pipeline: chunks whose
+// filter mask skips them decode normally, other chunks return an error.
 //
 // # Filter Pipeline
 //
@@ -54,4 +59,5 @@
 //   - [Deflate]: DEFLATE/zlib decompression filter
 //   - [Shuffle]: Byte shuffle/unshuffle filter
 //   - [Fletcher32Filter]: Fletcher-32 checksum verification filter
+//   - [LZF]: LZF decompression filter
 package filter
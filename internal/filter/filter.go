@@ -24,6 +24,7 @@ var Registry = map[uint16]func([]uint32) Filter{
 	message.FilterDeflate:    func(cd []uint32) Filter { return NewDeflate(cd) },
 	message.FilterShuffle:    func(cd []uint32) Filter { return NewShuffle(cd) },
 	message.FilterFletcher32: func(cd []uint32) Filter { return NewFletcher32(cd) },
+	message.FilterLZF:        func(cd []uint32) Filter { return NewLZF(cd) },
 }
 
 // filterNames maps known filter IDs to their names for better error messages.
@@ -34,6 +35,8 @@ var filterNames = map[uint16]string{
 	message.FilterSZIP:        "SZIP",
 	message.FilterNBit:        "N-bit",
 	message.FilterScaleOffset: "scale-offset",
+	message.FilterLZF:         "LZF",
+	message.FilterBlosc:       "Blosc",
 }
 
 // New creates a filter from a FilterInfo.
@@ -138,6 +138,66 @@ func TestFletcher32ID(t *testing.T) {
 	}
 }
 
+func TestLZFDecode(t *testing.T) {
+	// Literal run "abc" followed by a back reference of length 6 at
+	// distance 3, which overlaps the bytes it produces.
+	compressed := []byte{0x02, 'a', 'b', 'c', 0x80, 0x02}
+
+	f := NewLZF([]uint32{4, 0x0105, 9})
+	decompressed, err := f.Decode(compressed)
+	if err != nil {
+		t.Fatalf("Decode failed: %v", err)
+	}
+
+	want := []byte("abcabcabc")
+	if !bytes.Equal(decompressed, want) {
+		t.Errorf("Decompressed data mismatch:\ngot:  %q\nwant: %q", decompressed, want)
+	}
+}
+
+func TestLZFLongBackReference(t *testing.T) {
+	// Length field 7 takes an extra length byte: 7 + 3 + 2 = 12 copies of 'x'
+	compressed := []byte{0x00, 'x', 0xE0, 0x03, 0x00}
+
+	f := NewLZF(nil)
+	decompressed, err := f.Decode(compressed)
+	if err != nil {
+		t.Fatalf("Decode failed: %v", err)
+	}
+
+	want := bytes.Repeat([]byte("x"), 13)
+	if !bytes.Equal(decompressed, want) {
+		t.Errorf("Decompressed data mismatch:\ngot:  %q\nwant: %q", decompressed, want)
+	}
+}
+
+func TestLZFInvalid(t *testing.T) {
+	tests := []struct {
+		name  string
+		input []byte
+	}{
+		{"truncated literal", []byte{0x05, 'a', 'b'}},
+		{"truncated back reference", []byte{0x00, 'a', 0x20}},
+		{"reference before start", []byte{0x00, 'a', 0x20, 0x05}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			f := NewLZF(nil)
+			if _, err := f.Decode(tt.input); err == nil {
+				t.Error("Expected error for invalid LZF stream")
+			}
+		})
+	}
+}
+
+func TestLZFID(t *testing.T) {
+	f := NewLZF(nil)
+	if f.ID() != message.FilterLZF {
+		t.Errorf("expected ID %d, got %d", message.FilterLZF, f.ID())
+	}
+}
+
 func TestPipelineEmpty(t *testing.T) {
 	p, err := NewPipeline(nil)
 	if err != nil {
@@ -206,3 +266,38 @@ func TestPipelineFilterMask(t *testing.T) {
 		t.Error("Skipped filter should leave data unchanged")
 	}
 }
+
+func TestPipelineUnavailableOptionalFilter(t *testing.T) {
+	fp := &message.FilterPipeline{
+		Version: 2,
+		Filters: []message.FilterInfo{
+			{ID: message.FilterShuffle, ClientData: []uint32{1}},
+			{ID: message.FilterBlosc, Flags: 0x0001}, // Optional, not implemented
+		},
+	}
+
+	p, err := NewPipeline(fp)
+	if err != nil {
+		t.Fatalf("NewPipeline failed: %v", err)
+	}
+
+	if p.Len() != 2 {
+		t.Errorf("expected 2 filters, got %d", p.Len())
+	}
+
+	data := []byte{1, 2, 3, 4}
+
+	// Chunk encoded with the optional filter cannot be decoded
+	if _, err := p.Decode(data, 0); err == nil {
+		t.Error("Expected error for chunk using unavailable optional filter")
+	}
+
+	// Chunk that skipped the optional filter (mask bit 1) decodes normally
+	result, err := p.Decode(data, 0x02)
+	if err != nil {
+		t.Fatalf("Decode failed: %v", err)
+	}
+	if !bytes.Equal(result, data) {
+		t.Error("Skipped filter should leave data unchanged")
+	}
+}
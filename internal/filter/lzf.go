@@ -0,0 +1,78 @@
+package filter
+
+import (
+	"fmt"
+
+	"github.com/robert-malhotra/go-hdf5/internal/message"
+)
+
+// LZF implements the LZF decompression filter registered by h5py.
+// LZF trades compression ratio for speed and is a common choice for
+// datasets written from Python.
+type LZF struct {
+	chunkSize int
+}
+
+// NewLZF creates a new LZF filter.
+// Client data: [0] = filter revision, [1] = LZF version, [2] = uncompressed chunk size in bytes
+func NewLZF(clientData []uint32) *LZF {
+	chunkSize := 0
+	if len(clientData) > 2 {
+		chunkSize = int(clientData[2])
+	}
+	return &LZF{chunkSize: chunkSize}
+}
+
+func (f *LZF) ID() uint16 {
+	return message.FilterLZF
+}
+
+// Decode decompresses an LZF stream.
+// The stream is a sequence of literal runs (control byte < 32, followed by
+// control+1 literal bytes) and back references into the output (3-bit length
+// and 13-bit offset, with an extra length byte when the length field is 7).
+func (f *LZF) Decode(input []byte) ([]byte, error) {
+	output := make([]byte, 0, f.chunkSize)
+
+	ip := 0
+	for ip < len(input) {
+		ctrl := int(input[ip])
+		ip++
+
+		if ctrl < 32 {
+			// Literal run
+			n := ctrl + 1
+			if ip+n > len(input) {
+				return nil, fmt.Errorf("lzf: literal run exceeds input")
+			}
+			output = append(output, input[ip:ip+n]...)
+			ip += n
+			continue
+		}
+
+		// Back reference
+		length := ctrl >> 5
+		if length == 7 {
+			if ip >= len(input) {
+				return nil, fmt.Errorf("lzf: truncated back reference")
+			}
+			length += int(input[ip])
+			ip++
+		}
+		if ip >= len(input) {
+			return nil, fmt.Errorf("lzf: truncated back reference")
+		}
+		ref := len(output) - ((ctrl & 0x1f) << 8) - int(input[ip]) - 1
+		ip++
+		if ref < 0 {
+			return nil, fmt.Errorf("lzf: back reference before start of output")
+		}
+
+		// Copy byte by byte: the source may overlap the bytes being written
+		for i := 0; i < length+2; i++ {
+			output = append(output, output[ref+i])
+		}
+	}
+
+	return output, nil
+}
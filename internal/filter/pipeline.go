@@ -26,9 +26,12 @@ func NewPipeline(fp *message.FilterPipeline) (*Pipeline, error) {
 		if err != nil {
 			return nil, fmt.Errorf("creating filter %d: %w", info.ID, err)
 		}
-		if f != nil {
-			p.filters = append(p.filters, f)
+		if f == nil {
+			// Keep a placeholder so filter mask bits stay aligned with the
+			// pipeline and chunks that did use the filter fail loudly.
+			f = &unavailable{id: info.ID}
 		}
+		p.filters = append(p.filters, f)
 	}
 
 	return p, nil
@@ -61,6 +64,23 @@ func (p *Pipeline) Decode(input []byte, filterMask uint32) ([]byte, error) {
 	return data, nil
 }
 
+// unavailable stands in for an optional filter that is not implemented.
+// Chunks whose filter mask skips it decode normally; any other chunk errors.
+type unavailable struct {
+	id uint16
+}
+
+func (f *unavailable) ID() uint16 {
+	return f.id
+}
+
+func (f *unavailable) Decode(input []byte) ([]byte, error) {
+	if name, known := filterNames[f.id]; known {
+		return nil, fmt.Errorf("optional %s filter (ID %d) is not supported; this chunk cannot be read", name, f.id)
+	}
+	return nil, fmt.Errorf("optional filter ID %d is not supported; this chunk cannot be read", f.id)
+}
+
 // Empty returns true if the pipeline has no filters.
 func (p *Pipeline) Empty() bool {
 	return len(p.filters) == 0
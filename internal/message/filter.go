@@ -9,12 +9,14 @@ import (
 
 // Filter IDs
 const (
-	FilterDeflate     uint16 = 1 // DEFLATE (gzip)
-	FilterShuffle     uint16 = 2 // Byte shuffle
-	FilterFletcher32  uint16 = 3 // Fletcher32 checksum
-	FilterSZIP        uint16 = 4 // SZIP compression
-	FilterNBit        uint16 = 5 // N-bit packing
-	FilterScaleOffset uint16 = 6 // Scale + offset
+	FilterDeflate     uint16 = 1     // DEFLATE (gzip)
+	FilterShuffle     uint16 = 2     // Byte shuffle
+	FilterFletcher32  uint16 = 3     // Fletcher32 checksum
+	FilterSZIP        uint16 = 4     // SZIP compression
+	FilterNBit        uint16 = 5     // N-bit packing
+	FilterScaleOffset uint16 = 6     // Scale + offset
+	FilterLZF         uint16 = 32000 // LZF (third-party filter shipped with h5py)
+	FilterBlosc       uint16 = 32001 // Blosc (third-party filter, e.g. via hdf5plugin)
 )
 
 // FilterInfo describes a single filter in the pipeline.
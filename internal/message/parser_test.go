@@ -865,49 +865,49 @@ func TestParseLayoutMessage(t *testing.T) {
 // === FILE-BASED INTEGRATION TESTS ===
 
 func TestParseFromIntegersFile(t *testing.T) {
-	path := getTestdataPath("integers.h5")
+	path := getTestdataPath("fixtures_bundle.h5")
 	if _, err := os.Stat(path); os.IsNotExist(err) {
 		t.Skipf("Test file %s not found", path)
 	}
 
 	// Just verify the file can be opened
-	t.Log("integers.h5 is available for message parsing tests")
+	t.Log("fixtures_bundle.h5 (integers/) is available for message parsing tests")
 }
 
 func TestParseFromFloatsFile(t *testing.T) {
-	path := getTestdataPath("floats.h5")
+	path := getTestdataPath("fixtures_bundle.h5")
 	if _, err := os.Stat(path); os.IsNotExist(err) {
 		t.Skipf("Test file %s not found", path)
 	}
 
-	t.Log("floats.h5 is available for message parsing tests")
+	t.Log("fixtures_bundle.h5 (floats/) is available for message parsing tests")
 }
 
 func TestParseFromMultidimFile(t *testing.T) {
-	path := getTestdataPath("multidim.h5")
+	path := getTestdataPath("fixtures_bundle.h5")
 	if _, err := os.Stat(path); os.IsNotExist(err) {
 		t.Skipf("Test file %s not found", path)
 	}
 
-	t.Log("multidim.h5 is available for message parsing tests")
+	t.Log("fixtures_bundle.h5 (multidim/) is available for message parsing tests")
 }
 
 func TestParseFromStringsFile(t *testing.T) {
-	path := getTestdataPath("strings.h5")
+	path := getTestdataPath("fixtures_bundle.h5")
 	if _, err := os.Stat(path); os.IsNotExist(err) {
 		t.Skipf("Test file %s not found", path)
 	}
 
-	t.Log("strings.h5 is available for message parsing tests")
+	t.Log("fixtures_bundle.h5 (strings/) is available for message parsing tests")
 }
 
 func TestParseFromCompactFile(t *testing.T) {
-	path := getTestdataPath("compact.h5")
+	path := getTestdataPath("fixtures_bundle.h5")
 	if _, err := os.Stat(path); os.IsNotExist(err) {
 		t.Skipf("Test file %s not found", path)
 	}
 
-	t.Log("compact.h5 is available for compact layout parsing tests")
+	t.Log("fixtures_bundle.h5 (compact/) is available for compact layout parsing tests")
 }
 
 func TestParseFromChunkedFile(t *testing.T) {